@@ -45,11 +45,6 @@ while [ $# -gt 0 ]; do
   shift
 done
 
-# Get latest URLs for download
-VAR_TERRASCAN_URL=$(curl -sL https://api.github.com/repos/accurics/terrascan/releases/latest | grep browser_download_url | grep "Linux_x86" | cut -d '"' -f 4)
-VAR_TFSECGEN_URL=$(curl -sL https://api.github.com/repos/aquasecurity/tfsec/releases | grep browser_download_url | grep tfsec-checkgen-linux-amd64 | awk 'NR==1' | cut -d '"' -f 4)
-VAR_TFSEC_URL=$(curl -sL https://api.github.com/repos/aquasecurity/tfsec/releases | grep browser_download_url | grep tfsec-linux-amd64 | awk 'NR==1' | cut -d '"' -f 4)
-
 ### Functions
 
 function install-tflint () {
@@ -57,11 +52,24 @@ function install-tflint () {
 }
 
 function terraform-lint () {
+  local d subdir resolved root seen nl=$'\n'
   tflint --version
   tflint
-  arr=(*/)
-  for d in "${arr[@]}"; do
-    subdir=$(echo $d | sed "s,/$,,")
+  root=$(pwd -P)
+  seen="$nl$root$nl"
+  for d in */; do
+    subdir=${d%/}
+    [ -d "$subdir" ] || continue
+    # Only symlinks can alias another directory, so only they are resolved
+    if [ -L "$subdir" ]; then
+      resolved=$(cd "$subdir" 2>/dev/null && pwd -P) || resolved="$root/$subdir"
+    else
+      resolved="$root/$subdir"
+    fi
+    case $seen in
+      *"$nl$resolved$nl"*) continue ;;
+    esac
+    seen="$seen$resolved$nl"
     ( cd $subdir && tflint )
   done
 }
@@ -104,6 +112,8 @@ function checkovoutput-file () {
 }
 
 function install-terrascan () {
+  # Get latest URL for download
+  VAR_TERRASCAN_URL=$(curl -sL https://api.github.com/repos/accurics/terrascan/releases/latest | grep browser_download_url | grep "Linux_x86" | cut -d '"' -f 4)
   curl -L $VAR_TERRASCAN_URL \
   -o terrascan.tar.gz
   tar -xf terrascan.tar.gz terrascan && rm -f terrascan.tar.gz
@@ -123,6 +133,10 @@ function terrascan-scan () {
 }
 
 function install-tfsec () {
+  # Get latest URLs for download
+  VAR_TFSEC_RELEASES=$(curl -sL https://api.github.com/repos/aquasecurity/tfsec/releases | grep browser_download_url)
+  VAR_TFSECGEN_URL=$(echo "$VAR_TFSEC_RELEASES" | grep tfsec-checkgen-linux-amd64 | awk 'NR==1' | cut -d '"' -f 4)
+  VAR_TFSEC_URL=$(echo "$VAR_TFSEC_RELEASES" | grep tfsec-linux-amd64 | awk 'NR==1' | cut -d '"' -f 4)
   curl -L $VAR_TFSECGEN_URL -o tfsec-checkgen
   install tfsec-checkgen /usr/bin
   rm -f tfsec-checkgen